@@ -7,8 +7,21 @@ import sys
 from typing import Optional
 
 from . import configure, get_departures, search_stations
+from .client import DBApiClient, create_default_client
 from .stations import resolve_station_eva
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(value: object) -> str:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+else:
+
+    def _dumps(value: object) -> str:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+
 
 def _configure_from_args(args: argparse.Namespace) -> None:
     if args.client_id or args.api_key:
@@ -81,14 +94,23 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     _configure_from_args(args)
 
+    # one client (and connection pool) for every request of this run
+    client = create_default_client()
+    try:
+        return _run(args, client)
+    finally:
+        client.close()
+
+
+def _run(args: argparse.Namespace, client: DBApiClient) -> int:
     if args.search:
-        stations = search_stations(args.station, limit=args.limit)
-        print(json.dumps(stations, indent=2, ensure_ascii=False))
+        stations = search_stations(args.station, client=client, limit=args.limit)
+        print(_dumps(stations))
         return 0
 
     station_id = args.station
     if args.resolve:
-        station_id = resolve_station_eva(args.station)
+        station_id = resolve_station_eva(args.station, client=client)
 
     now = dt.datetime.now(dt.timezone.utc)
     end = now + dt.timedelta(hours=args.hours)
@@ -97,11 +119,12 @@ def main(argv: Optional[list[str]] = None) -> int:
         station_id=station_id,
         start_time=now,
         end_time=end,
+        client=client,
         include_recent_changes=args.recent,
     )
 
     if args.json:
-        print(json.dumps(departures, indent=2, ensure_ascii=False))
+        print(_dumps(departures))
         return 0
 
     if not departures:
@@ -3,10 +3,21 @@ from __future__ import annotations
 import os
 import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Tuple, Type, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional speedup
+    httpx = None
+    _TRANSPORT_ERRORS: Tuple[Type[Exception], ...] = (requests.RequestException,)
+else:
+    _TRANSPORT_ERRORS = (requests.RequestException, httpx.HTTPError)
 
 from .config import DEFAULT_TIMEOUT, get_settings
 from .exceptions import AuthenticationError, BahnAPIError, RateLimitError
@@ -15,14 +26,59 @@ BASE_URL = "https://apis.deutschebahn.com/db-api-marketplace/apis/timetables/v1"
 PLAN_CACHE_TTL = 60 * 60  # 1 hour
 CHANGES_CACHE_TTL = 30  # seconds
 STATION_CACHE_TTL = 12 * 60 * 60  # 12 hours
+CACHE_MAX_ENTRIES = 2048
+MAX_PARALLEL_REQUESTS = 8
+CONNECTION_POOL_SIZE = 16
+
+Session = Union[requests.Session, "httpx.Client"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class _CacheEntry:
     expires_at: float
     value: str
 
 
+def _requests_session() -> requests.Session:
+    """Default session: pooled keep-alive connections, retries on 502/503/504."""
+    session = requests.Session()
+    # all calls go to a single host; keep enough sockets alive for parallel fetches
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=CONNECTION_POOL_SIZE,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def http2_session() -> "httpx.Client":
+    """
+    Opt-in HTTP/2 session factory, multiplexing parallel fetches over one connection.
+
+    Pass as ``DBApiClient(session_factory=http2_session)``; requires the
+    ``http2`` extra. Connection failures are retried, 5xx responses are not.
+    """
+    if httpx is None:
+        raise ImportError('HTTP/2 support requires httpx: pip install "bahnapi[http2]"')
+    limits = httpx.Limits(
+        max_keepalive_connections=MAX_PARALLEL_REQUESTS,
+        max_connections=CONNECTION_POOL_SIZE,
+    )
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+        follow_redirects=True,
+    )
+
+
 class DBApiClient:
     """Lightweight client for the Deutsche Bahn Timetables API."""
 
@@ -32,7 +88,7 @@ class DBApiClient:
         api_key: Optional[str] = None,
         *,
         timeout: int = DEFAULT_TIMEOUT,
-        session_factory: Callable[[], requests.Session] = requests.Session,
+        session_factory: Callable[[], Session] = _requests_session,
     ) -> None:
         settings = get_settings()
 
@@ -46,6 +102,7 @@ class DBApiClient:
             )
 
         self._timeout = timeout if timeout != DEFAULT_TIMEOUT else settings.timeout
+        # requests.Session or httpx.Client; both expose headers/request/close
         self._session = session_factory()
         self._session.headers.update(
             {
@@ -56,6 +113,7 @@ class DBApiClient:
             }
         )
         self._cache: Dict[str, _CacheEntry] = {}
+        self._inflight: Dict[str, Future] = {}
         self._lock = threading.Lock()
 
     def close(self) -> None:
@@ -82,20 +140,58 @@ class DBApiClient:
     def _cached_get(self, path: str, ttl: int) -> str:
         cache_key = path
         now = time.time()
+        # Lock-free hit path: entries are immutable and replaced wholesale, and
+        # a single dict lookup is atomic, so readers never see a torn entry.
+        entry = self._cache.get(cache_key)
+        if entry and entry.expires_at > now:
+            return entry.value
+
         with self._lock:
+            # re-check; another thread may have stored it in the meantime
             entry = self._cache.get(cache_key)
             if entry and entry.expires_at > now:
                 return entry.value
-
-        payload = self._request("GET", path)
+            # coalesce concurrent misses for the same path into one request
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                future: Future = Future()
+                self._inflight[cache_key] = future
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            payload = self._request("GET", path)
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[cache_key]
+            future.set_exception(exc)
+            raise
 
         with self._lock:
+            # re-insert so dict order tracks age for eviction
+            self._cache.pop(cache_key, None)
+            if len(self._cache) >= CACHE_MAX_ENTRIES:
+                self._evict(now)
             self._cache[cache_key] = _CacheEntry(expires_at=now + ttl, value=payload)
+            del self._inflight[cache_key]
+        future.set_result(payload)
         return payload
 
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, or the oldest one if none expired. Caller holds the lock."""
+        expired = [key for key, entry in self._cache.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._cache[key]
+        if not expired:
+            del self._cache[next(iter(self._cache))]
+
     def _request(self, method: str, path: str) -> str:
         url = f"{BASE_URL}{path}"
-        response = self._session.request(method, url, timeout=self._timeout)
+        try:
+            response = self._session.request(method, url, timeout=self._timeout)
+        except _TRANSPORT_ERRORS as exc:
+            raise BahnAPIError(f"DB API request failed: {exc}") from exc
 
         if response.status_code in {401, 403}:
             raise AuthenticationError("Authentication failed against the DB API.")
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from typing import Optional
 
 DEFAULT_TIMEOUT = 10
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
     client_id: Optional[str] = None
     api_key: Optional[str] = None
@@ -41,5 +41,5 @@ def configure(
 
 
 def get_settings() -> Settings:
-    """Return a copy of the active settings."""
-    return replace(_active_settings)
+    """Return the active settings (immutable, safe to share)."""
+    return _active_settings
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .client import DBApiClient, create_default_client
+from .client import MAX_PARALLEL_REQUESTS, DBApiClient, create_default_client
 from .parsers import parse_changes, parse_plan
-from .utils import parse_time, to_jsonable
+from .utils import to_jsonable
 
 
 def get_departures(
@@ -42,17 +44,15 @@ def get_departures(
     try:
         plan_entries = _collect_plan_entries(api_client, station_id, start_time, end_time)
         changes = _collect_changes(api_client, station_id, include_recent_changes)
-        departures = _merge_plan_and_changes(plan_entries, changes)
+        departures = _merge_plan_and_changes(plan_entries, changes, start_time, end_time)
     finally:
         if client is None:
             api_client.close()
 
-    filtered = _filter_by_interval(departures, start_time, end_time)
-    filtered.sort(
-        key=lambda item: parse_time(item["departure_actual"])
-        or parse_time(item["departure_planned"])
-    )
-    return filtered
+    departures.sort(key=itemgetter("_sort_key"))
+    for dep in departures:
+        del dep["_sort_key"]
+    return departures
 
 
 # --------------------------------------------------------------------------- #
@@ -65,12 +65,22 @@ def _collect_plan_entries(
     start_time: dt.datetime,
     end_time: dt.datetime,
 ) -> Dict[str, Dict]:
-    """Fetch and parse plan slices covering the timeframe."""
+    """Fetch (concurrently) and parse plan slices covering the timeframe."""
     plan_events: Dict[str, Dict] = {}
-    for date_str, hour_str in _iter_time_slices(start_time, end_time):
-        xml_payload = client.fetch_plan(station_id, date_str, hour_str)
-        plan_chunk = parse_plan(xml_payload)
-        plan_events.update(plan_chunk)
+    slices = list(_iter_time_slices(start_time, end_time))
+    if len(slices) == 1:
+        # nothing to overlap; skip the thread pool start-up
+        return parse_plan(client.fetch_plan(station_id, *slices[0]))
+
+    workers = min(MAX_PARALLEL_REQUESTS, len(slices))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        payloads = executor.map(
+            lambda time_slice: client.fetch_plan(station_id, *time_slice), slices
+        )
+        # map() yields in slice order, so later hours still win on update()
+        for xml_payload in payloads:
+            plan_chunk = parse_plan(xml_payload)
+            plan_events.update(plan_chunk)
     return plan_events
 
 
@@ -94,19 +104,26 @@ def _collect_changes(
 def _merge_plan_and_changes(
     plan_events: Dict[str, Dict],
     changes: Dict[str, Dict],
+    start_time: dt.datetime,
+    end_time: dt.datetime,
 ) -> List[Dict]:
+    """Merge plan and changes, keeping only stops departing within [start, end]."""
     merged: List[Dict] = []
 
-    all_ids = set(plan_events.keys()) | set(changes.keys())
-
-    for stop_id in all_ids:
-        plan = plan_events.get(stop_id, {})
-        change = changes.get(stop_id, {})
-
-        line_info = plan.get("planned_line") or {}
-
+    for stop_id, plan, change in _iter_stop_pairs(plan_events, changes):
         planned_departure = plan.get("planned_departure")
         actual_departure = change.get("actual_departure") or planned_departure
+        if actual_departure is None or not start_time <= actual_departure <= end_time:
+            continue
+
+        line_info = plan.get("planned_line") or {}
+        planned_platform = plan.get("planned_platform")
+        departure_planned = to_jsonable(planned_departure)
+        departure_actual = (
+            departure_planned
+            if actual_departure is planned_departure
+            else to_jsonable(actual_departure)
+        )
 
         delay_minutes = None
         if actual_departure and planned_departure:
@@ -122,18 +139,19 @@ def _merge_plan_and_changes(
         result = {
             "stop_id": stop_id,
             "station_eva": change.get("station_eva") or plan.get("station_eva"),
-            "departure_planned": to_jsonable(planned_departure),
-            "departure_actual": to_jsonable(actual_departure),
+            "departure_planned": departure_planned,
+            "departure_actual": departure_actual,
             "delay_minutes": delay_minutes,
-            "platform_planned": plan.get("planned_platform"),
-            "platform_actual": change.get("actual_platform")
-            or plan.get("planned_platform"),
+            "platform_planned": planned_platform,
+            "platform_actual": change.get("actual_platform") or planned_platform,
             "status": change.get("status"),
             "destination_name": change.get("destination")
             or plan.get("planned_destination"),
             "train_category": line_info.get("category"),
             "train_number": line_info.get("number"),
             "operator": line_info.get("operator"),
+            # effective departure, dropped again once sorted
+            "_sort_key": actual_departure,
         }
         if messages:
             result["messages"] = messages
@@ -143,47 +161,25 @@ def _merge_plan_and_changes(
     return merged
 
 
-def _filter_by_interval(
-    departures: List[Dict],
-    start_time: dt.datetime,
-    end_time: dt.datetime,
-) -> List[Dict]:
-    filtered: List[Dict] = []
-    for dep in departures:
-        actual = parse_time(dep.get("departure_actual"))
-        planned = parse_time(dep.get("departure_planned"))
-        pivot = actual or planned
-        if pivot is None:
-            continue
-        if start_time <= pivot <= end_time:
-            filtered.append(dep)
-    return filtered
+def _iter_stop_pairs(
+    plan_events: Dict[str, Dict],
+    changes: Dict[str, Dict],
+) -> Iterator[Tuple[str, Dict, Dict]]:
+    """Yield (stop_id, plan, change) for every stop in plan or changes."""
+    for stop_id, plan in plan_events.items():
+        yield stop_id, plan, changes.get(stop_id, {})
+    for stop_id, change in changes.items():
+        if stop_id not in plan_events:
+            yield stop_id, {}, change
 
 
 def _merge_messages(*message_groups: Iterable[Dict]) -> List[Dict]:
-    merged: List[Dict] = []
-    seen_ids = set()
+    # dict keeps first-seen order; messages without id are kept as-is
+    merged: Dict[object, Dict] = {}
     for group in message_groups:
-        if not group:
-            continue
-        for message in group:
-            message_id = message.get("id")
-            if message_id and message_id in seen_ids:
-                continue
-            if message_id:
-                seen_ids.add(message_id)
-            simplified = {
-                "id": message.get("id"),
-                "type": message.get("type"),
-                "code": message.get("code"),
-                "category": message.get("category"),
-                "priority": message.get("priority"),
-                "text": message.get("text"),
-                "valid_from": message.get("valid_from"),
-                "valid_to": message.get("valid_to"),
-            }
-            merged.append(simplified)
-    return merged
+        for message in group or ():
+            merged.setdefault(message.get("id") or id(message), message)
+    return list(merged.values())
 
 
 def _iter_time_slices(
@@ -197,7 +193,10 @@ def _iter_time_slices(
 
     current = start
     while current <= end:
-        yield current.strftime("%y%m%d"), current.strftime("%H")
+        yield (
+            f"{current.year % 100:02d}{current.month:02d}{current.day:02d}",
+            f"{current.hour:02d}",
+        )
         current += dt.timedelta(hours=1)
 
 
@@ -209,4 +208,7 @@ __all__ = ["get_departures"]
 def _normalize_datetime(value: dt.datetime) -> dt.datetime:
     if value.tzinfo is None:
         return value
+    # already UTC (e.g. datetime.now(timezone.utc)): skip the tz conversion
+    if value.tzinfo is dt.timezone.utc or value.utcoffset() == dt.timedelta(0):
+        return value.replace(tzinfo=None)
     return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml is an optional speedup
+    import xml.etree.ElementTree as ET
+
+    _PARSER = None
+    _PARSER_OPTIONS: Dict[str, object] = {}
+else:
+    # Entity resolution and ID tracking are not needed. Input is already-decoded
+    # text re-encoded as UTF-8, so the encoding is forced and any declaration in
+    # the document is ignored.
+    _PARSER_OPTIONS = {
+        "encoding": "utf-8",
+        "huge_tree": False,
+        "collect_ids": False,
+        "resolve_entities": False,
+    }
+    # reused across calls for tree parsing
+    _PARSER = ET.XMLParser(**_PARSER_OPTIONS)
 
 from .utils import parse_time
 
@@ -10,9 +29,9 @@ def parse_station_list(xml_text: str) -> List[Dict[str, str]]:
     """Parse XML response of /station endpoint."""
     if not xml_text:
         return []
-    root = ET.fromstring(xml_text)
+    root = _fromstring(xml_text)
     stations = []
-    for station in root.findall(".//station"):
+    for station in root.iterfind(".//station"):
         stations.append(
             {
                 "name": station.attrib.get("name"),
@@ -20,7 +39,6 @@ def parse_station_list(xml_text: str) -> List[Dict[str, str]]:
                 "ds100": station.attrib.get("ds100"),
                 "meta": station.attrib.get("meta"),
                 "platform": station.attrib.get("p"),
-                "raw": station.attrib,
             }
         )
     return stations
@@ -31,35 +49,30 @@ def parse_plan(xml_text: str) -> Dict[str, Dict]:
     if not xml_text:
         return {}
 
-    root = ET.fromstring(xml_text)
     plan_events: Dict[str, Dict] = {}
 
-    for station in root.findall("s"):
-        stop_id = station.attrib.get("id")
+    for stop in _parse_stops(xml_text):
+        stop_id = stop.attrs.get("id")
         if not stop_id:
             continue
 
-        dp = station.find("dp")
-        if dp is None:
+        dp_attrs = stop.departure
+        if dp_attrs is None:
             # skip stops without departure component
             continue
 
-        path = _split_path(dp.attrib.get("ppth"))
-        line_info = _extract_line_info(station.find("tl"))
+        path = _split_path(dp_attrs.get("ppth"))
+        line_info = _line_info(stop.line)
 
         plan_events[stop_id] = {
             "stop_id": stop_id,
-            "station_eva": station.attrib.get("eva"),
-            "planned_departure": parse_time(dp.attrib.get("pt")),
-            "planned_platform": dp.attrib.get("pp"),
+            "station_eva": stop.attrs.get("eva"),
+            "planned_departure": parse_time(dp_attrs.get("pt")),
+            "planned_platform": dp_attrs.get("pp"),
             "planned_path": path,
             "planned_destination": path[-1] if path else None,
             "planned_line": line_info,
-            "remarks": _extract_messages(station.findall("m")),
-            "raw": {
-                "station": station.attrib,
-                "departure": dp.attrib,
-            },
+            "remarks": stop.messages,
         }
 
     return plan_events
@@ -70,79 +83,172 @@ def parse_changes(xml_text: str) -> Dict[str, Dict]:
     if not xml_text:
         return {}
 
-    root = ET.fromstring(xml_text)
     change_events: Dict[str, Dict] = {}
 
-    for station in root.findall("s"):
-        stop_id = station.attrib.get("id")
+    for stop in _parse_stops(xml_text):
+        stop_id = stop.attrs.get("id")
         if not stop_id:
             continue
 
-        dp = station.find("dp")
-        if dp is None:
+        dp_attrs = stop.departure
+        if dp_attrs is None:
             continue
 
-        path = _split_path(dp.attrib.get("ppth"))
+        path = _split_path(dp_attrs.get("ppth"))
 
         change_events[stop_id] = {
             "stop_id": stop_id,
-            "station_eva": station.attrib.get("eva"),
-            "actual_departure": parse_time(dp.attrib.get("ct") or dp.attrib.get("rt")),
-            "actual_platform": dp.attrib.get("cp"),
-            "status": dp.attrib.get("cs"),
-            "messages": _extract_messages(dp.findall("m")),
+            "station_eva": stop.attrs.get("eva"),
+            "actual_departure": parse_time(dp_attrs.get("ct") or dp_attrs.get("rt")),
+            "actual_platform": dp_attrs.get("cp"),
+            "status": dp_attrs.get("cs"),
+            "messages": stop.departure_messages,
             "path": path,
             "destination": path[-1] if path else None,
-            "raw": {
-                "station": station.attrib,
-                "departure": dp.attrib,
-            },
         }
 
         # propagate station-level messages if present
-        station_messages = _extract_messages(station.findall("m"))
-        if station_messages:
-            change_events[stop_id]["station_messages"] = station_messages
+        if stop.messages:
+            change_events[stop_id]["station_messages"] = stop.messages
 
     return change_events
 
 
+class _Stop(NamedTuple):
+    """Attributes of one top-level ``<s>`` and the children the parsers read."""
+
+    attrs: Mapping[str, str]
+    departure: Optional[Mapping[str, str]]
+    line: Optional[Mapping[str, str]]
+    messages: List[Dict[str, Optional[str]]]
+    departure_messages: List[Dict[str, Optional[str]]]
+
+
+class _StopTarget:
+    """
+    XMLParser target collecting ``<s>`` stops straight from parser events.
+
+    Works with both lxml and ElementTree; no Element objects are ever created.
+    """
+
+    def __init__(self) -> None:
+        self.stops: List[_Stop] = []
+        self._depth = 0
+        self._attrs: Optional[Mapping[str, str]] = None
+        self._departure: Optional[Mapping[str, str]] = None
+        self._line: Optional[Mapping[str, str]] = None
+        self._messages: List[Dict[str, Optional[str]]] = []
+        self._departure_messages: List[Dict[str, Optional[str]]] = []
+        self._in_departure = False
+        self._message: Optional[Dict[str, Optional[str]]] = None
+        self._message_text: List[str] = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if self._message is not None:
+            # like Element.text, message text ends at the first child
+            self._close_message()
+        self._depth += 1
+        depth = self._depth
+        if depth == 2:
+            self._attrs = attrib if tag == "s" else None
+            if self._attrs is not None:
+                self._departure = self._line = None
+                self._messages = []
+                self._departure_messages = []
+        elif self._attrs is None:
+            return
+        elif depth == 3:
+            if tag == "dp" and self._departure is None:
+                self._departure = attrib
+                self._in_departure = True
+            elif tag == "tl" and self._line is None:
+                self._line = attrib
+            elif tag == "m":
+                self._open_message(attrib, self._messages)
+        elif depth == 4 and tag == "m" and self._in_departure:
+            self._open_message(attrib, self._departure_messages)
+
+    def data(self, data: str) -> None:
+        if self._message is not None:
+            self._message_text.append(data)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        if self._attrs is None:
+            return
+        if self._message is not None:
+            self._close_message()
+        elif depth == 2:
+            self.stops.append(
+                _Stop(
+                    self._attrs,
+                    self._departure,
+                    self._line,
+                    self._messages,
+                    self._departure_messages,
+                )
+            )
+            self._attrs = None
+        elif depth == 3 and tag == "dp":
+            self._in_departure = False
+
+    def close(self) -> List[_Stop]:
+        return self.stops
+
+    def _open_message(
+        self, attrib: Mapping[str, str], messages: List[Dict[str, Optional[str]]]
+    ) -> None:
+        self._message = _message(attrib, None)
+        self._message_text = []
+        messages.append(self._message)
+
+    def _close_message(self) -> None:
+        self._message["text"] = "".join(self._message_text) or None
+        self._message = None
+
+
+def _fromstring(xml_text: str) -> ET.Element:
+    if _PARSER is None:
+        return ET.fromstring(xml_text)
+    # lxml rejects str input carrying an encoding declaration
+    return ET.fromstring(xml_text.encode("utf-8"), _PARSER)
+
+
+def _parse_stops(xml_text: str) -> List[_Stop]:
+    parser = ET.XMLParser(target=_StopTarget(), **_PARSER_OPTIONS)
+    # same input handling as _fromstring: str for ElementTree, UTF-8 bytes for lxml
+    parser.feed(xml_text if _PARSER is None else xml_text.encode("utf-8"))
+    return parser.close()
+
+
 def _split_path(path: Optional[str]) -> List[str]:
     if not path:
         return []
     return [segment.strip() for segment in path.split("|") if segment.strip()]
 
 
-def _extract_line_info(line_element: Optional[ET.Element]) -> Optional[Dict[str, Optional[str]]]:
-    if line_element is None:
+def _line_info(attrs: Optional[Mapping[str, str]]) -> Optional[Dict[str, Optional[str]]]:
+    if attrs is None:
         return None
-    attrs = line_element.attrib
     return {
         "category": attrs.get("c"),
         "number": attrs.get("n"),
         "type": attrs.get("t"),
         "operator": attrs.get("o"),
         "line": attrs.get("l"),
-        "additional": attrs,
     }
 
 
-def _extract_messages(elements: List[ET.Element]) -> List[Dict[str, Optional[str]]]:
-    messages: List[Dict[str, Optional[str]]] = []
-    for msg in elements:
-        attrs = msg.attrib
-        messages.append(
-            {
-                "id": attrs.get("id"),
-                "type": attrs.get("t"),
-                "code": attrs.get("c"),
-                "category": attrs.get("cat"),
-                "priority": attrs.get("pr"),
-                "timestamp": attrs.get("ts"),
-                "valid_from": attrs.get("from"),
-                "valid_to": attrs.get("to"),
-                "text": msg.text,
-                "raw": attrs,
-            }
-        )
-    return messages
+def _message(attrs: Mapping[str, str], text: Optional[str]) -> Dict[str, Optional[str]]:
+    return {
+        "id": attrs.get("id"),
+        "type": attrs.get("t"),
+        "code": attrs.get("c"),
+        "category": attrs.get("cat"),
+        "priority": attrs.get("pr"),
+        "timestamp": attrs.get("ts"),
+        "valid_from": attrs.get("from"),
+        "valid_to": attrs.get("to"),
+        "text": text,
+    }
@@ -1,32 +1,46 @@
 from __future__ import annotations
 
 import datetime as dt
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=8192)
 def parse_time(value: Optional[str]) -> Optional[dt.datetime]:
     """
-    Parse DB API timestamp attributes (ISO 8601 or YYMMDDHHMM format).
+    Parse DB API timestamp attributes (YYMMDDHHMM or ISO 8601 format).
 
     Returns naive datetime in local timezone assumptions. If format is unknown,
-    returns None.
+    returns None. Results are cached per input string.
     """
     if not value:
         return None
-    # Most attributes are ISO 8601.
-    try:
-        return dt.datetime.fromisoformat(value)
-    except ValueError:
-        pass
-    # Fallback: YYMMDDHHmm or similar numeric string.
-    if len(value) in (10, 12):
+    # Timetable attributes (pt/ct/rt) are YYMMDDHHmm (or YYYYMMDDHHmm);
+    # build those directly instead of going through strptime.
+    # isascii(): str.isdigit() also accepts e.g. superscript or Arabic-Indic digits
+    if len(value) in (10, 12) and value.isascii() and value.isdigit():
+        if len(value) == 10:
+            year = int(value[0:2])
+            # same century pivot as strptime's %y
+            year += 2000 if year < 69 else 1900
+        else:
+            year = int(value[0:4])
+        rest = value[-8:]  # MMDDHHmm
         try:
-            if len(value) == 10:
-                return dt.datetime.strptime(value, "%y%m%d%H%M")
-            return dt.datetime.strptime(value, "%Y%m%d%H%M")
+            return dt.datetime(
+                year,
+                int(rest[0:2]),
+                int(rest[2:4]),
+                int(rest[4:6]),
+                int(rest[6:8]),
+            )
         except ValueError:
             return None
-    return None
+    # Rare fallback: ISO 8601.
+    try:
+        return dt.datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 def to_jsonable(dt_value: Optional[dt.datetime]) -> Optional[str]:
@@ -0,0 +1,102 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from bahnapi import client as client_module
+from bahnapi.client import DBApiClient
+from bahnapi.exceptions import BahnAPIError
+
+
+class _FakeResponse:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+class _FakeSession:
+    """Stands in for requests.Session; counts calls per URL."""
+
+    def __init__(self, status_code=200, delay=0.0):
+        self.headers = {}
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, method, url, timeout=None):
+        with self._lock:
+            self.calls.append(url)
+        time.sleep(self.delay)
+        return _FakeResponse(self.status_code, f"<payload url='{url}'/>")
+
+    def close(self):
+        pass
+
+
+def _make_client(session):
+    return DBApiClient("client-id", "api-key", session_factory=lambda: session)
+
+
+def test_concurrent_misses_share_one_request():
+    session = _FakeSession(delay=0.2)
+    api = _make_client(session)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(lambda _: api.fetch_full_changes("8011160"), range(20)))
+
+    assert len(session.calls) == 1
+    assert set(results) == {results[0]}
+    assert api._inflight == {}
+    # subsequent calls are served from the cache
+    api.fetch_full_changes("8011160")
+    assert len(session.calls) == 1
+
+
+def test_request_error_reaches_every_waiter():
+    session = _FakeSession(status_code=500, delay=0.2)
+    api = _make_client(session)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(api.fetch_station, "Berlin") for _ in range(10)]
+        errors = [future.exception() for future in futures]
+
+    assert len(session.calls) == 1
+    assert all(isinstance(error, BahnAPIError) for error in errors)
+    assert api._inflight == {}
+    assert api._cache == {}
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(client_module, "CACHE_MAX_ENTRIES", 5)
+    session = _FakeSession()
+    api = _make_client(session)
+
+    for hour in range(12):
+        api.fetch_plan("8011160", "241015", f"{hour:02d}")
+        assert len(api._cache) <= 5
+
+    # the most recent entries survive eviction
+    api.fetch_plan("8011160", "241015", "11")
+    assert len(session.calls) == 12
+
+
+def test_default_session_is_requests():
+    api = DBApiClient("client-id", "api-key")
+    assert isinstance(api._session, requests.Session)
+    api.close()
+
+
+def test_transport_errors_become_bahnapi_errors():
+    session = _FakeSession()
+
+    def fail(method, url, timeout=None):
+        raise requests.ConnectionError("connection refused")
+
+    session.request = fail
+    api = _make_client(session)
+
+    with pytest.raises(BahnAPIError, match="connection refused"):
+        api.fetch_station("Berlin")
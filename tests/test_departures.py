@@ -0,0 +1,123 @@
+import datetime as dt
+
+import pytest
+
+from bahnapi.departures import _iter_time_slices, _normalize_datetime, get_departures
+
+
+def _timetable(*stops):
+    return "<timetable station='Köln Hbf'>" + "".join(stops) + "</timetable>"
+
+
+def _plan_stop(stop_id, planned):
+    return f'<s id="{stop_id}" eva="8000207"><tl c="RE" n="1"/><dp pt="{planned}" pp="1" ppth="Bonn"/></s>'
+
+
+def _change_stop(stop_id, changed):
+    return f'<s id="{stop_id}" eva="8000207"><dp ct="{changed}" cp="2"/></s>'
+
+
+class _FakeClient:
+    """Serves canned XML per (date, hour) slice; records the slices requested."""
+
+    def __init__(self, plans, changes=""):
+        self.plans = plans
+        self.changes = changes
+        self.plan_calls = []
+
+    def fetch_plan(self, station_id, date, hour):
+        self.plan_calls.append((date, hour))
+        return self.plans.get((date, hour), "")
+
+    def fetch_full_changes(self, station_id):
+        return self.changes
+
+    def fetch_recent_changes(self, station_id):
+        return ""
+
+    def close(self):
+        pass
+
+
+def test_window_bounds_are_inclusive():
+    client = _FakeClient(
+        {
+            ("241015", "12"): _timetable(
+                _plan_stop("early", "2410151159"),
+                _plan_stop("start", "2410151200"),
+                _plan_stop("middle", "2410151230"),
+            ),
+            ("241015", "13"): _timetable(
+                _plan_stop("end", "2410151300"),
+                _plan_stop("late", "2410151301"),
+            ),
+        }
+    )
+
+    departures = get_departures(
+        "8000207", dt.datetime(2024, 10, 15, 12, 0), dt.datetime(2024, 10, 15, 13, 0), client=client
+    )
+
+    assert [dep["stop_id"] for dep in departures] == ["start", "middle", "end"]
+    assert client.plan_calls == [("241015", "12"), ("241015", "13")]
+
+
+def test_sorted_by_effective_departure_without_sort_key():
+    client = _FakeClient(
+        {
+            ("241015", "12"): _timetable(
+                _plan_stop("delayed", "2410151205"),
+                _plan_stop("on-time", "2410151210"),
+            )
+        },
+        changes=_timetable(_change_stop("delayed", "2410151220")),
+    )
+
+    departures = get_departures(
+        "8000207", dt.datetime(2024, 10, 15, 12, 0), dt.datetime(2024, 10, 15, 12, 59), client=client
+    )
+
+    assert [dep["stop_id"] for dep in departures] == ["on-time", "delayed"]
+    assert departures[1]["departure_planned"] == "2024-10-15T12:05:00"
+    assert departures[1]["departure_actual"] == "2024-10-15T12:20:00"
+    assert departures[1]["delay_minutes"] == 15
+    assert departures[1]["platform_actual"] == "2"
+    assert all("_sort_key" not in dep for dep in departures)
+
+
+def test_later_plan_slice_wins():
+    client = _FakeClient(
+        {
+            ("241015", "12"): _timetable(_plan_stop("shared", "2410151250")),
+            ("241015", "13"): _timetable(_plan_stop("shared", "2410151310")),
+            ("241015", "14"): _timetable(),
+        }
+    )
+
+    departures = get_departures(
+        "8000207", dt.datetime(2024, 10, 15, 12, 0), dt.datetime(2024, 10, 15, 14, 0), client=client
+    )
+
+    assert [dep["departure_planned"] for dep in departures] == ["2024-10-15T13:10:00"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (dt.datetime(2024, 10, 15, 12, 0), dt.datetime(2024, 10, 15, 12, 0)),
+        (dt.datetime(2024, 10, 15, 12, 0, tzinfo=dt.timezone.utc), dt.datetime(2024, 10, 15, 12, 0)),
+        (
+            dt.datetime(2024, 10, 15, 12, 0, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+            dt.datetime(2024, 10, 15, 10, 0),
+        ),
+    ],
+)
+def test_normalize_datetime(value, expected):
+    result = _normalize_datetime(value)
+    assert result == expected
+    assert result.tzinfo is None
+
+
+def test_iter_time_slices_cross_day_boundary():
+    slices = _iter_time_slices(dt.datetime(2024, 12, 31, 23, 30), dt.datetime(2025, 1, 1, 1, 5))
+    assert list(slices) == [("241231", "23"), ("250101", "00"), ("250101", "01")]
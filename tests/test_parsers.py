@@ -0,0 +1,138 @@
+import datetime as dt
+import importlib
+import sys
+
+import pytest
+
+import bahnapi.parsers
+
+PLAN_XML = """<?xml version='1.0' encoding='ISO-8859-1'?>
+<timetable station="Köln Hbf">
+  <s id="a-1" eva="8000207">
+    <tl f="F" t="p" o="80" c="ICE" n="123"/>
+    <ar pt="2410151159" pp="7"/>
+    <dp pt="2410151201" pp="7" ppth="Düsseldorf Hbf|Hamburg Hbf"/>
+    <m id="r1" t="q" c="42" ts="2410151100">Bordbistro<b/>geschlossen</m>
+  </s>
+  <s id="b-2" eva="8000207"><tl c="RE" n="5"/><ar pt="2410151210"/></s>
+  <s eva="8000207"><dp pt="2410151215"/></s>
+  <s id="c-3" eva="8000207">
+    <dp pt="2410151230" pp="15" ppth="Bonn"/>
+    <dp pt="2410151299" pp="99"/>
+    <tl c="S" n="7"/>
+    <tl c="X" n="0"/>
+  </s>
+  <other><s id="nested" eva="1"><dp pt="2410151240"/></s></other>
+</timetable>"""
+
+CHANGES_XML = """<?xml version='1.0' encoding='UTF-8'?>
+<timetable station="Köln Hbf" eva="8000207">
+  <s id="a-1" eva="8000207">
+    <m id="s1" t="h" c="99" cat="Info" pr="2" from="2410150000" to="2410160000">Gleisänderung</m>
+    <dp ct="2410151206" cp="8" cs="p" ppth="Düsseldorf Hbf|Hamburg Hbf"><m id="d1" t="d" c="36"/></dp>
+  </s>
+  <s id="z-9" eva="8000207"><dp rt="2410151240" cs="a"/></s>
+  <s id="y-8" eva="8000207"><ar ct="2410151241"/></s>
+</timetable>"""
+
+STATIONS_XML = """<?xml version='1.0' encoding='ISO-8859-1'?>
+<stations>
+  <station p="1|2" meta="8073368" name="Köln Hbf" eva="8000207" ds100="KK"/>
+  <station name="Köln Messe/Deutz" eva="8003368" ds100="KKDZ"/>
+</stations>"""
+
+
+def _message(**values):
+    message = dict.fromkeys(
+        ["id", "type", "code", "category", "priority", "timestamp", "valid_from", "valid_to", "text"]
+    )
+    message.update(values)
+    return message
+
+
+@pytest.fixture(params=["lxml", "stdlib"])
+def parsers(request, monkeypatch):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    else:
+        monkeypatch.setitem(sys.modules, "lxml", None)
+    module = importlib.reload(bahnapi.parsers)
+    assert (module._PARSER is None) == (request.param == "stdlib")
+    yield module
+    monkeypatch.undo()
+    importlib.reload(bahnapi.parsers)
+
+
+def test_parse_plan(parsers):
+    assert parsers.parse_plan(PLAN_XML) == {
+        "a-1": {
+            "stop_id": "a-1",
+            "station_eva": "8000207",
+            "planned_departure": dt.datetime(2024, 10, 15, 12, 1),
+            "planned_platform": "7",
+            "planned_path": ["Düsseldorf Hbf", "Hamburg Hbf"],
+            "planned_destination": "Hamburg Hbf",
+            "planned_line": {"category": "ICE", "number": "123", "type": "p", "operator": "80", "line": None},
+            "remarks": [_message(id="r1", type="q", code="42", timestamp="2410151100", text="Bordbistro")],
+        },
+        "c-3": {
+            "stop_id": "c-3",
+            "station_eva": "8000207",
+            "planned_departure": dt.datetime(2024, 10, 15, 12, 30),
+            "planned_platform": "15",
+            "planned_path": ["Bonn"],
+            "planned_destination": "Bonn",
+            "planned_line": {"category": "S", "number": "7", "type": None, "operator": None, "line": None},
+            "remarks": [],
+        },
+    }
+
+
+def test_parse_changes(parsers):
+    assert parsers.parse_changes(CHANGES_XML) == {
+        "a-1": {
+            "stop_id": "a-1",
+            "station_eva": "8000207",
+            "actual_departure": dt.datetime(2024, 10, 15, 12, 6),
+            "actual_platform": "8",
+            "status": "p",
+            "messages": [_message(id="d1", type="d", code="36")],
+            "path": ["Düsseldorf Hbf", "Hamburg Hbf"],
+            "destination": "Hamburg Hbf",
+            "station_messages": [
+                _message(
+                    id="s1",
+                    type="h",
+                    code="99",
+                    category="Info",
+                    priority="2",
+                    valid_from="2410150000",
+                    valid_to="2410160000",
+                    text="Gleisänderung",
+                )
+            ],
+        },
+        "z-9": {
+            "stop_id": "z-9",
+            "station_eva": "8000207",
+            "actual_departure": dt.datetime(2024, 10, 15, 12, 40),
+            "actual_platform": None,
+            "status": "a",
+            "messages": [],
+            "path": [],
+            "destination": None,
+        },
+    }
+
+
+def test_parse_station_list(parsers):
+    assert parsers.parse_station_list(STATIONS_XML) == [
+        {"name": "Köln Hbf", "eva": "8000207", "ds100": "KK", "meta": "8073368", "platform": "1|2"},
+        {"name": "Köln Messe/Deutz", "eva": "8003368", "ds100": "KKDZ", "meta": None, "platform": None},
+    ]
+
+
+def test_empty_payloads(parsers):
+    assert parsers.parse_plan("") == {}
+    assert parsers.parse_changes("") == {}
+    assert parsers.parse_station_list("") == []
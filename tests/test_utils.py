@@ -0,0 +1,24 @@
+import datetime as dt
+
+import pytest
+
+from bahnapi.utils import parse_time
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2410151201", dt.datetime(2024, 10, 15, 12, 1)),
+        ("6901010000", dt.datetime(1969, 1, 1, 0, 0)),
+        ("202410151201", dt.datetime(2024, 10, 15, 12, 1)),
+        ("2024-10-15T12:01:00", dt.datetime(2024, 10, 15, 12, 1)),
+        ("2413011200", None),
+        ("²²²²²²²²²²", None),
+        ("٢٤١٠١٥١٢٠١", None),
+        ("abc", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_time(value, expected):
+    assert parse_time(value) == expected